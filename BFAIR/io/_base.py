@@ -1,18 +1,22 @@
 __all__ = []
 
-from cobra.core.singleton import Singleton
 
+class _BaseFactory:
+    # Each factory is instantiated once, as a module-level object, so no singleton metaclass is needed
+    # Subclasses must provide the ``_list`` of members, either as an attribute or as a property
 
-class _BaseFactory(metaclass=Singleton):
     def __init__(self, factory_method):
         self._factory_method = factory_method
-        self._list = []
+        self._set = None
 
     def __dir__(self):
         return self._list
 
     def __getattr__(self, item):
-        if item in self._list:
+        # the list keeps the order for dir(), membership is tested against a set built on first use
+        if self._set is None:
+            self._set = frozenset(self._list)
+        if item in self._set:
             return self._factory_method(item)
         return super().__getattribute__(item)
 
@@ -2,10 +2,13 @@
 
 __all__ = []
 
-from pathlib import Path
+import os.path
 
 from BFAIR.io import static
 
+# Resolved once, as it is needed on every call to static_path
+STATIC_DIR = os.path.dirname(static.__file__)
+
 
 def static_path(*args) -> str:
     """
@@ -21,4 +24,4 @@ def static_path(*args) -> str:
     str
     """
     # Output must be str to be compatible with cobra/pytfa
-    return str(Path(static.__file__).parent.joinpath(*args))
+    return os.path.join(STATIC_DIR, *args)
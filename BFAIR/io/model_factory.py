@@ -6,39 +6,77 @@ This module hosts functions to load cobra models, create and adjust tFBA-ready m
 __all__ = ["load_cbm", "load_data", "create_model", "models", "thermo_models"]
 
 import logging
-from pathlib import Path
-
-from cobra import Model
-from cobra.io import load_json_model
-from pytfa import ThermoModel
-from pytfa.io import load_thermoDB, read_lexicon, read_compartment_data, annotate_from_lexicon, apply_compartment_data
-from pytfa.utils.logger import get_bistream_logger
+import os
+from copy import deepcopy
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from BFAIR.io._base import _BaseFactory
-from BFAIR.io._path import static_path
+from BFAIR.io._path import STATIC_DIR, static_path
+
+# cobra and pytfa are slow to import, so they are only imported by the functions that need them
+if TYPE_CHECKING:
+    from cobra import Model
+    from pytfa import ThermoModel
+
+_THERMO_DB_PATH = static_path("thermo_data.thermodb")
+
+
+def _list_static_models():
+    # Lists the names of the JSON models in the static folder, a plain suffix check is enough (no need for glob)
+    with os.scandir(STATIC_DIR) as entries:
+        return [
+            entry.name[:-5]
+            for entry in entries
+            if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file()
+        ]
 
 
 class _ModelFactory(_BaseFactory):
     def __init__(self):
         super().__init__(load_cbm)
-        self._list = [path.stem for path in Path(static_path()).glob("*.json")]
+        self._model_names = None
+
+    @property
+    def _list(self):
+        # scanned on first access only, so importing the package does not touch the file system
+        if self._model_names is None:
+            self._model_names = _list_static_models()
+        return self._model_names
 
 
 class _ThermoModelFactory(_BaseFactory):
     def __init__(self):
         super().__init__(create_model)
-        self._list = [path.stem for path in Path(static_path()).glob("*.json") if path.with_suffix("").exists()]
+        self._model_names = None
+
+    @property
+    def _list(self):
+        # a model is tFBA-ready if a folder with its thermodynamic data sits next to the JSON file
+        if self._model_names is None:
+            self._model_names = [
+                model_name for model_name in _list_static_models() if os.path.exists(static_path(model_name))
+            ]
+        return self._model_names
+
+
+_SILENCED_LOGGERS = set()
 
 
 def _silence_pytfa(logger_name):
     # Disables the stream logs produced by the pytfa module, keeps file logs
+    if logger_name in _SILENCED_LOGGERS:
+        return
+    from pytfa.utils.logger import get_bistream_logger
+
     logger = get_bistream_logger(logger_name)
     for handler in logger.handlers:
         if not isinstance(handler, logging.FileHandler):
             handler.setLevel(logging.ERROR)
+    _SILENCED_LOGGERS.add(logger_name)
 
 
-def load_cbm(model_name) -> Model:
+def load_cbm(model_name) -> "Model":
     """
     Load a JSON cobra model stored in the static folder.
 
@@ -52,13 +90,35 @@ def load_cbm(model_name) -> Model:
     cobra.Model
         The loaded cobra model.
     """
+    from cobra.io import load_json_model
+
     return load_json_model(static_path(model_name + ".json"))
 
 
+@lru_cache(maxsize=1)
+def _load_thermo_db():
+    # The thermodynamic database is shared by all models and expensive to unpickle, so it is read only once
+    from pytfa.io import load_thermoDB
+
+    return load_thermoDB(_THERMO_DB_PATH)
+
+
+@lru_cache(maxsize=None)
+def _load_model_data(model_name):
+    from pytfa.io import read_compartment_data, read_lexicon
+
+    lexicon = read_lexicon(static_path(model_name, "lexicon.csv"))
+    compartment_data = read_compartment_data(static_path(model_name, "compartment_data.json"))
+    return lexicon, compartment_data
+
+
 def load_data(model_name):
     """
     Loads pre-curated model-specific thermodynamic information.
 
+    The files are only read the first time a model's data is requested. The thermodynamic database is shared between
+    calls and must not be modified in place, whereas copies of the lexicon and compartment data are returned.
+
     Parameters
     ----------
     model_name : str
@@ -73,13 +133,11 @@ def load_data(model_name):
     compartment_data : dict
         A dictionary with information about each compartment of the model.
     """
-    thermo_data = load_thermoDB(static_path("thermo_data.thermodb"))
-    lexicon = read_lexicon(static_path(model_name, "lexicon.csv"))
-    compartment_data = read_compartment_data(static_path(model_name, "compartment_data.json"))
-    return thermo_data, lexicon, compartment_data
+    lexicon, compartment_data = _load_model_data(model_name)
+    return _load_thermo_db(), lexicon.copy(), deepcopy(compartment_data)
 
 
-def create_model(model_name, thermo_data=None, lexicon=None, compartment_data=None) -> ThermoModel:
+def create_model(model_name, thermo_data=None, lexicon=None, compartment_data=None) -> "ThermoModel":
     """
     Creates a tFBA-ready model.
 
@@ -106,6 +164,9 @@ def create_model(model_name, thermo_data=None, lexicon=None, compartment_data=No
     ValueError
         If any (but not all) of ``thermo_data``, ``lexicon``, and ``compartment_data`` is None.
     """
+    from pytfa import ThermoModel
+    from pytfa.io import annotate_from_lexicon, apply_compartment_data
+
     data_is_none = [data is None for data in [thermo_data, lexicon, compartment_data]]
     if all(data_is_none):
         thermo_data, lexicon, compartment_data = load_data(model_name)
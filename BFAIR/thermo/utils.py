@@ -25,6 +25,11 @@ def _check_if_solved(tmodel: ThermoModel):
         raise ValueError("Model must be solved first.")
 
 
+def _iter_bounds(bounds):
+    # iterates over the id, lb and ub columns of a bounds table
+    return zip(*(bounds[column].to_numpy().tolist() for column in ("id", "lb", "ub")))
+
+
 def adjust_model(tmodel: ThermoModel, rxn_bounds, lc_bounds):
     """
     Adjusts the flux bounds and log concentration of a tFBA-ready model.
@@ -41,16 +46,27 @@ def adjust_model(tmodel: ThermoModel, rxn_bounds, lc_bounds):
         columns: ``id``, ``lb``, and ``ub``.
     """
     # constrain reactions (e.g., growth rate, uptake/secretion rates)
-    for rxn_id, lb, ub in zip(rxn_bounds["id"], rxn_bounds["lb"], rxn_bounds["ub"]):
-        if tmodel.reactions.has_id(rxn_id):
-            tmodel.parent.reactions.get_by_id(rxn_id).bounds = lb, ub
-            tmodel.reactions.get_by_id(rxn_id).bounds = lb, ub
-    # constrain log concentrations
-    for met, lb, ub in zip(lc_bounds["id"], lc_bounds["lb"], lc_bounds["ub"]):
-        for compartment in tmodel.compartments:
-            met_id = met + "_" + compartment
-            if tmodel.log_concentration.has_id(met_id):
-                (tmodel.log_concentration.get_by_id(met_id).variable.set_bounds(lb, ub))
+    rxn_bounds = rxn_bounds[rxn_bounds["id"].isin(tmodel.reactions.list_attr("id"))]
+    get_rxn = tmodel.reactions.get_by_id
+    get_parent_rxn = tmodel.parent.reactions.get_by_id
+    for rxn_id, lb, ub in _iter_bounds(rxn_bounds):
+        rxn = get_rxn(rxn_id)
+        parent_rxn = get_parent_rxn(rxn_id)
+        # skip assignments that would not change the bounds
+        bounds = lb, ub
+        if parent_rxn.bounds != bounds:
+            parent_rxn.bounds = bounds
+        if rxn.bounds != bounds:
+            rxn.bounds = bounds
+    # constrain log concentrations (of a metabolite in every compartment)
+    bound_map = {
+        f"{met}_{compartment}": (lb, ub)
+        for met, lb, ub in _iter_bounds(lc_bounds)
+        for compartment in tmodel.compartments
+    }
+    for lc in tmodel.log_concentration:
+        if lc.id in bound_map:
+            lc.variable.set_bounds(*bound_map[lc.id])
 
 
 def get_flux(tmodel: ThermoModel):
@@ -1,3 +1,4 @@
+import gzip
 import unittest
 import pickle
 import sys
@@ -13,31 +14,37 @@ current_dir = str(pathlib.Path(__file__).parent.absolute())
 
 class test_methods(unittest.TestCase):
     def setUp(self):
-        file_obj = open(
-            current_dir + "/test_data/MFA_modelInputsData/test_data.obj", "rb"
-        )
-        (
-            modelReaction_data_I,
-            atomMappingReactions_data_I,
-            atomMappingMetabolite_data_I,
-            measuredFluxes_data_I,
-            experimentalMS_data_I,
-            tracer_I,
-            initiated_MATLAB_script,
-            model_reactions,
-            model_rxn_ids,
-            initialized_model,
-            symmetrical_metabolites_script,
-            unbalanced_reactions_script,
-            reaction_parameters,
-            verify_and_estimate_script,
-            experimental_parameters,
-            fragments_used,
-            mapping_script,
-            script,
-            runner,
-        ) = pickle.load(file_obj)
-        file_obj.close()
+        with gzip.open(
+            current_dir + "/test_data/MFA_modelInputsData/test_inputs.obj",
+            "rb",
+        ) as file_obj:
+            (
+                modelReaction_data_I,
+                atomMappingReactions_data_I,
+                atomMappingMetabolite_data_I,
+                measuredFluxes_data_I,
+                experimentalMS_data_I,
+                tracer_I,
+            ) = pickle.load(file_obj)
+        with gzip.open(
+            current_dir + "/test_data/MFA_modelInputsData/test_expected.obj",
+            "rb",
+        ) as file_obj:
+            (
+                initiated_MATLAB_script,
+                model_reactions,
+                model_rxn_ids,
+                initialized_model,
+                symmetrical_metabolites_script,
+                unbalanced_reactions_script,
+                reaction_parameters,
+                verify_and_estimate_script,
+                experimental_parameters,
+                fragments_used,
+                mapping_script,
+                script,
+                runner,
+            ) = pickle.load(file_obj)
 
         self.modelReaction_data_I = modelReaction_data_I
         self.atomMappingReactions_data_I = atomMappingReactions_data_I
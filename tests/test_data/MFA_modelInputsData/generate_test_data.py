@@ -4,34 +4,80 @@
 # This script is intended to generate sample data and save them into the
 # test_data file. The saved objects will then be used to test the
 # INCA_script_generator using unit testing.
+import gzip
 import pickle
+import pickletools
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from BFAIR.INCA import INCA_script
 
 
 pd.set_option("mode.chained_assignment", None)
-# Use pickle to save python variables
-filehandler = open("test_data.obj", "wb")
 
 INCA_script = INCA_script()
 
+
+def _read_csv(pathname, column, value):
+    # pyarrow is not part of the environment and pandas 1.1 has no pyarrow
+    # engine, so parse with the C engine in a single pass over each file.
+    # Rows not matching the model/experiment are dropped chunk by chunk, so the
+    # limit_to_one_* functions below only iterate over the rows that are kept
+    chunks = pd.read_csv(
+        pathname, engine="c", low_memory=False, chunksize=200_000
+    )
+    return pd.concat([chunk[chunk[column] == value] for chunk in chunks])
+
+
 # measured fragments/MS data, tracers and measured fluxes should be limited to
 # one experiment
 
-atomMappingReactions_data_I = pd.read_csv(
-    "data_stage02_isotopomer_atomMappingReactions2.csv"
-)
-modelReaction_data_I = pd.read_csv(
-    "data_stage02_isotopomer_modelReactions.csv"
-)
-atomMappingMetabolite_data_I = pd.read_csv(
-    "data_stage02_isotopomer_atomMappingMetabolites.csv"
-)
-measuredFluxes_data_I = pd.read_csv(
-    "data_stage02_isotopomer_measuredFluxes.csv"
-)
-experimentalMS_data_I = pd.read_csv("Re-import/experimentalMS_data_I.csv")
-tracer_I = pd.read_csv("data_stage02_isotopomer_tracers.csv")
+# The files are independent, so they are read concurrently (pandas releases
+# the GIL while parsing)
+model_id = "ecoli_RL2013_02"
+experiment_id = "WTEColi_113C80_U13C20_01"
+read_args = {
+    "atomMappingReactions": (
+        "data_stage02_isotopomer_atomMappingReactions2.csv",
+        "mapping_id",
+        model_id,
+    ),
+    "modelReaction": (
+        "data_stage02_isotopomer_modelReactions.csv",
+        "model_id",
+        model_id,
+    ),
+    "atomMappingMetabolite": (
+        "data_stage02_isotopomer_atomMappingMetabolites.csv",
+        "mapping_id",
+        model_id,
+    ),
+    "measuredFluxes": (
+        "data_stage02_isotopomer_measuredFluxes.csv",
+        "model_id",
+        model_id,
+    ),
+    "experimentalMS": (
+        "Re-import/experimentalMS_data_I.csv",
+        "experiment_id",
+        experiment_id,
+    ),
+    "tracer": (
+        "data_stage02_isotopomer_tracers.csv",
+        "experiment_id",
+        experiment_id,
+    ),
+}
+with ThreadPoolExecutor(max_workers=len(read_args)) as executor:
+    input_data = dict(
+        zip(read_args, executor.map(_read_csv, *zip(*read_args.values())))
+    )
+
+atomMappingReactions_data_I = input_data["atomMappingReactions"]
+modelReaction_data_I = input_data["modelReaction"]
+atomMappingMetabolite_data_I = input_data["atomMappingMetabolite"]
+measuredFluxes_data_I = input_data["measuredFluxes"]
+experimentalMS_data_I = input_data["experimentalMS"]
+tracer_I = input_data["tracer"]
 
 # The files need to be limited by model id and mapping id, I picked
 # "ecoli_RL2013_02" here
@@ -116,7 +162,20 @@ script = INCA_script.script_generator(
 )
 runner = INCA_script.runner_script_generator("TestFile", n_estimates=10)
 
-pickle.dump(
+
+def _dump(objects, filename):
+    # Use pickle to save python variables, optimize() drops unused memo
+    # entries to get a smaller stream that loads faster. The scripts are
+    # mostly text and compress well, even at the fastest gzip level.
+    # Protocol 4 is the highest one the Python 3.7 test environment can load
+    data = pickle.dumps(objects, protocol=4)
+    with gzip.open(filename, "wb", compresslevel=1) as filehandler:
+        filehandler.write(pickletools.optimize(data))
+
+
+# The inputs and the expected outputs are saved separately, so that each is
+# stored once and can be loaded on its own
+_dump(
     [
         modelReaction_data_I,
         atomMappingReactions_data_I,
@@ -124,6 +183,11 @@ pickle.dump(
         measuredFluxes_data_I,
         experimentalMS_data_I,
         tracer_I,
+    ],
+    "test_inputs.obj",
+)
+_dump(
+    [
         initiated_MATLAB_script,
         model_reactions,
         model_rxn_ids,
@@ -138,7 +202,5 @@ pickle.dump(
         script,
         runner,
     ],
-    filehandler,
+    "test_expected.obj",
 )
-
-filehandler.close()
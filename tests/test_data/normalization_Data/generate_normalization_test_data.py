@@ -17,84 +17,10 @@ filehandler = open("test_data.obj", "wb")
 
 with open("Ecoli_intensities_linearity.txt", "rb") as handle:
     df = pickle.loads(handle.read())
-# hardcoded for now, should be changed in future versions
-# only valid for E. coli
-biomass_mets = [
-    "phe__L_c",
-    "mlthf_c",
-    "oaa_c",
-    "lys__L_c",
-    "atp_c",
-    "ser__L_c",
-    "g3p_c",
-    "tyr__L_c",
-    "pep_c",
-    "met__L_c",
-    "g6p_c",
-    "akg_c",
-    "glu__L_c",
-    "gln__L_c",
-    "r5p_c",
-    "f6p_c",
-    "pyr_c",
-    "gly_c",
-    "thr_c",
-    "asp__L_c",
-    "nadph_c",
-    "cys__L_c",
-    "3pg_c",
-    "val__L_c",
-    "ala__L_c",
-    "ile__L_c",
-    "asn__L_c",
-    "his__L_c",
-    "leu__L_c",
-    "accoa_c",
-    "arg__L_c",
-    "pro__L_c",
-    "trp__L_c",
-    "nadh_c",
-]
-bm_vals = [
-    0.176,
-    0.443,
-    0.34,
-    0.326,
-    33.247,
-    0.205,
-    0.129,
-    0.131,
-    0.051,
-    0.146,
-    0.205,
-    0.087,
-    0.25,
-    0.25,
-    0.754,
-    0.071,
-    0.083,
-    0.582,
-    0.241,
-    0.229,
-    5.363,
-    0.087,
-    0.619,
-    0.402,
-    0.488,
-    0.276,
-    0.229,
-    0.09,
-    0.428,
-    2.51,
-    0.281,
-    0.21,
-    0.054,
-    -1.455,
-]
+# only valid for E. coli, the biomass composition is kept in a file next to
+# this script instead of being hardcoded
+biomass_df = pd.read_csv("biomass_function.csv")
 biomass_value = 39.68
-biomass_df = pd.DataFrame()
-biomass_df["Metabolite"] = biomass_mets
-biomass_df["Value"] = bm_vals
 amino_acids = [
     "ala__L_c",
     "arg__L_c",
@@ -45,6 +45,14 @@ class TestIO(unittest.TestCase):
         self.assertIsInstance(actual[2], dict)
         self.assertEqual(len(actual[2]), 3)
 
+    def test_load_data_copies(self):
+        _, lexicon, compartment_data = io.load_data("small_ecoli")
+        lexicon.iloc[0, 0] = "modified"
+        compartment_data["c"]["pH"] = 0.0
+        _, lexicon, compartment_data = io.load_data("small_ecoli")
+        self.assertEqual(lexicon.iloc[0, 0], "cpd00201")
+        self.assertEqual(compartment_data["c"]["pH"], 7.5)
+
     def test_create_model(self):
         tdata = io.load_data("small_ecoli")
         actual = io.create_model("small_ecoli", *tdata)